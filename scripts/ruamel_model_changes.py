@@ -8,17 +8,29 @@ in one call, reducing process overhead. The payload should contain:
   - model_name: Name of the model
   - column_changes: List of column updates
   - model_description: Optional model description update
+
+Several files can be updated in a single process by wrapping per-file
+payloads in `{"files": [...]}`. Results are then keyed by `patch_path`.
 """
 
 from __future__ import annotations
 
+import codecs
+import io
 import json
+import mmap
+import re
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 try:
     from ruamel.yaml import YAML
+    from ruamel.yaml.error import YAMLError
+    from ruamel.yaml.nodes import ScalarNode
+    from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 except ImportError:  # pragma: no cover - import error should bubble up clearly
     print(
         "ruamel.yaml is required to apply YAML updates. Install it with `pip install ruamel.yaml`.",
@@ -26,6 +38,41 @@ except ImportError:  # pragma: no cover - import error should bubble up clearly
     )
     raise
 
+try:
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads
+
+    orjson_dumps = None
+
+try:
+    from yaml import CSafeLoader, SafeDumper
+    from yaml import ScalarNode as PyYAMLScalarNode
+    from yaml import YAMLError as PyYAMLError
+    from yaml import load as libyaml_load
+except ImportError:  # pragma: no cover - libyaml bindings are optional
+    CSafeLoader = None
+    PyYAMLError = YAMLError
+
+# Built lazily and shared for the lifetime of the process.
+_RT_YAML: Optional[YAML] = None
+_SAFE_YAML: Optional[YAML] = None
+
+# Comments, anchors, aliases, tags and merge keys: anything the plain
+# PyYAML dumper would drop or rewrite. Deliberately over-matches.
+_NOT_PLAIN_YAML = re.compile(rb"(?:^|\s)#|[&*!][^\s,\]}]|<<\s*:")
+
+# Indentless block sequences, double-quoted scalars and lines past the default
+# width: layouts `IndentedSafeDumper` never writes. Deliberately over-matches.
+_NOT_PYYAML_LAYOUT = re.compile(rb'(?m)^( *)[^ \n-][^\n]*:\r?\n\1- |[:-] +"|^[^\n]{81}')
+
+# Files at least this large are pre-scanned from a memory map instead of a copy.
+_MMAP_THRESHOLD = 1 << 20
+
+# Marks a description key that was absent before an update.
+_MISSING = object()
+
 
 class PatchError(Exception):
     """Raised when the YAML structure does not match expectations."""
@@ -33,11 +80,176 @@ class PatchError(Exception):
 
 def load_payload() -> Dict[str, Any]:
     try:
-        return json.load(sys.stdin)
+        return json_loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as exc:  # pragma: no cover - input contract violation
         raise PatchError(f"Invalid JSON payload: {exc}") from exc
 
 
+def rt_yaml() -> YAML:
+    """Return the shared round-trip YAML instance used to load and dump files."""
+    global _RT_YAML
+    if _RT_YAML is None:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        _RT_YAML = yaml
+    return _RT_YAML
+
+
+def safe_yaml() -> YAML:
+    """Return the shared YAML 1.2 safe instance, which does not track comments."""
+    global _SAFE_YAML
+    if _SAFE_YAML is None:
+        _SAFE_YAML = YAML(typ="safe")
+    return _SAFE_YAML
+
+
+def safe_load(data: Union[bytes, mmap.mmap]) -> Any:
+    """Load YAML without comment tracking, using libyaml when it is available."""
+    if CSafeLoader is not None:
+        return libyaml_load(data, Loader=CSafeLoader)
+    return safe_yaml().load(data)
+
+
+@lru_cache(maxsize=4096)
+def plain_scalar_tag(value: str) -> str:
+    """Return the tag YAML 1.2 resolves `value` to when it is written unquoted.
+
+    PyYAML follows YAML 1.1, which reads e.g. `1e3` as a string, while ruamel
+    (and dbt) read it as a float, so only ruamel's resolver can decide this.
+    """
+    return str(rt_yaml().resolver.resolve(ScalarNode, value, (True, False)))
+
+
+def resolves_to_str(value: str) -> bool:
+    """Check that `value` written as a plain scalar is a string under YAML 1.2."""
+    return plain_scalar_tag(value) == "tag:yaml.org,2002:str"
+
+
+@contextmanager
+def mapped_file(path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield a read-only memory map of `path`, or its bytes if it cannot be mapped."""
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            mapped = None
+        if mapped is None:
+            yield handle.read()
+        else:
+            with mapped:
+                yield mapped
+
+
+@lru_cache(maxsize=None)
+def model_name_pattern(model_name: str) -> re.Pattern[bytes]:
+    return re.compile(rb"(?<!\w)" + re.escape(model_name.encode("utf-8")) + rb"(?!\w)")
+
+
+def check_models_present(
+    data: Union[bytes, mmap.mmap], model_updates: List[Dict[str, Any]]
+) -> None:
+    """Fail before parsing when a model name does not occur anywhere in `data`.
+
+    A match does not prove the model exists (that is left to `find_model`), but
+    a miss proves it does not, so no parser time is spent on such files.
+    """
+    for model_update in model_updates:
+        model_name = model_update.get("model_name")
+        if isinstance(model_name, str) and not model_name_pattern(model_name).search(data):
+            raise PatchError(f"Model `{model_name}` not found in YAML")
+
+
+if CSafeLoader is not None:
+
+    class DumpMismatch(Exception):
+        """Raised by `MatchingStream` at the first write that differs."""
+
+    class MatchingStream:
+        """Text stream that checks each write against `expected` instead of storing it."""
+
+        def __init__(self, expected: str) -> None:
+            self.expected = expected
+            self.position = 0
+
+        def write(self, text: str) -> None:
+            if not self.expected.startswith(text, self.position):
+                raise DumpMismatch
+            self.position += len(text)
+
+    class IndentedSafeDumper(SafeDumper):
+        """`SafeDumper` that writes sequences and plain scalars like the round-trip emitter.
+
+        libyaml's `CSafeDumper` always writes indentless sequences, which would
+        reformat every file dumped with `indent(mapping=2, sequence=4, offset=2)`.
+        Plain scalars are resolved as YAML 1.2, so `yes` stays plain and `1e3` is
+        quoted. Sets `wrapped` when a scalar in `new_values` spans lines or runs
+        past the width, where ruamel would lay it out differently.
+        """
+
+        new_values: AbstractSet[str] = frozenset()
+        wrapped = False
+
+        def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
+            return super().increase_indent(flow, False)
+
+        def resolve(self, kind: Any, value: Any, implicit: Tuple[bool, bool]) -> str:
+            if kind is PyYAMLScalarNode and implicit[0]:
+                return plain_scalar_tag(value)
+            return super().resolve(kind, value, implicit)
+
+        def choose_scalar_style(self) -> str:
+            style = super().choose_scalar_style()
+            # ruamel double-quotes rather than escape a `'` or fold a line break.
+            value = self.event.value
+            if style == "'" and self.analysis.allow_double_quoted and ("'" in value or "\n" in value):
+                return '"'
+            return style
+
+        def process_scalar(self) -> None:
+            line, value = self.line, self.event.value
+            super().process_scalar()
+            if value in self.new_values and (self.line != line or self.column > self.best_width):
+                self.wrapped = True
+
+    def fast_dump(document: Any, stream: Any, new_values: AbstractSet[str] = frozenset()) -> bool:
+        """Dump `document` to `stream`, returning False if any of `new_values` wrapped."""
+        dumper = IndentedSafeDumper(
+            stream, indent=2, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
+        dumper.new_values = new_values
+        try:
+            dumper.open()
+            dumper.represent(document)
+            dumper.close()
+        finally:
+            dumper.dispose()
+        return not dumper.wrapped
+
+
+def can_use_fast_path(data: bytes, safe_document: Any) -> bool:
+    """Check whether `data` can be rewritten with PyYAML instead of ruamel.yaml.
+
+    Only true when libyaml is available, the file has nothing the round-trip
+    loader exists to preserve, and dumping the plain document reproduces the
+    file byte for byte, so untouched parts of the file keep their formatting.
+    Layouts PyYAML never writes are rejected before dumping, and the dump is
+    checked as it is written, so a mismatch stops it at the first difference.
+    """
+    if CSafeLoader is None or _NOT_PLAIN_YAML.search(data) or _NOT_PYYAML_LAYOUT.search(data):
+        return False
+    try:
+        stream = MatchingStream(data.decode("utf-8"))
+        fast_dump(safe_document, stream)
+    except (UnicodeDecodeError, DumpMismatch):
+        return False
+    return stream.position == len(stream.expected)
+
+
+def has_changes(model_update: Dict[str, Any]) -> bool:
+    return bool(model_update.get("column_changes")) or "model_description" in model_update
+
+
 def ensure_sequence(value: Any, name: str) -> List[Any]:
     if value is None:
         return []
@@ -46,77 +258,310 @@ def ensure_sequence(value: Any, name: str) -> List[Any]:
     raise PatchError(f"Expected `{name}` to be a sequence, found {type(value).__name__}")
 
 
-def find_model(models: List[Any], model_name: str) -> Dict[str, Any]:
-    for entry in models:
-        if isinstance(entry, dict) and entry.get("name") == model_name:
-            return entry
-    raise PatchError(f"Model `{model_name}` not found in YAML")
+def index_by_name(entries: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """Map `name` to entry for every named mapping, keeping the first occurrence."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        if isinstance(entry, dict) and "name" in entry:
+            index.setdefault(entry["name"], entry)
+    return index
+
+
+def find_model(model_index: Dict[str, Dict[str, Any]], model_name: str) -> Dict[str, Any]:
+    model = model_index.get(model_name)
+    if model is None:
+        raise PatchError(f"Model `{model_name}` not found in YAML")
+    return model
+
+
+def ensure_column(
+    new_columns: List[Any], col_index: Dict[str, Dict[str, Any]], column_name: str
+) -> Dict[str, Any]:
+    """Look up a column, creating it in `col_index` and `new_columns` if missing.
+
+    New columns are collected rather than appended straight to the model's
+    column sequence so the caller can add them with a single `extend`.
+    """
+    column = col_index.get(column_name)
+    if column is None:
+        column = {"name": column_name}
+        new_columns.append(column)
+        col_index[column_name] = column
+    return column
+
+
+def matches_description(current: Any, description: str) -> bool:
+    """Check that a pre-scanned description already equals `description`.
+
+    The pre-scan may read YAML 1.1, where e.g. `1e3` is a string, and it does
+    not record quoting, so strings that YAML 1.2 would read as another type
+    never match and are left to the round-trip load to compare.
+    """
+    return isinstance(current, str) and current == description and resolves_to_str(current)
+
+
+def needs_update(yaml_document: Dict[str, Any], model_updates: List[Dict[str, Any]]) -> bool:
+    """Check whether any update would change the document.
+
+    Runs against a plain (non round-trip) load of the file so that the costly
+    round-trip parse can be skipped when every requested value already matches.
+    Raises the same errors as `apply_model_update` for missing models.
+    """
+    model_index = index_by_name(ensure_sequence(yaml_document.get("models"), "models"))
+    column_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for model_update in model_updates:
+        if not has_changes(model_update):
+            continue
+        model_name = model_update.get("model_name")
+        column_changes = model_update.get("column_changes", [])
+
+        model = find_model(model_index, model_name)
+        col_index = column_indexes.get(model_name)
+        if col_index is None:
+            columns = ensure_sequence(model.get("columns"), "columns")
+            col_index = column_indexes[model_name] = index_by_name(columns)
+
+        if "model_description" in model_update:
+            model_description = model_update.get("model_description")
+            if model_description is None:
+                if "description" in model:
+                    return True
+            elif not matches_description(model.get("description"), model_description):
+                return True
+
+        for change in column_changes:
+            column_name = change.get("column_name")
+            if not column_name:
+                continue
+            column = col_index.get(column_name, {})
+            new_description = change.get("new_description")
+            if new_description is None:
+                if "description" in column:
+                    return True
+            elif not matches_description(column.get("description"), new_description):
+                return True
+
+    return False
+
+
+def set_description(
+    entry: Dict[str, Any],
+    description: Optional[str],
+    edits: Optional[Dict[int, Tuple[Any, Any]]] = None,
+) -> bool:
+    """Set `entry`'s description, or remove it when `description` is None.
+
+    Returns whether the entry changed. When `edits` is given, the entry and its
+    original description are recorded there the first time it changes.
+    """
+    if description is None:
+        if "description" not in entry:
+            return False
+    elif entry.get("description") == description:
+        return False
 
+    if edits is not None:
+        edits.setdefault(id(entry), (entry, entry.get("description", _MISSING)))
 
-def ensure_column(columns: List[Any], column_name: str) -> Dict[str, Any]:
-    for entry in columns:
-        if isinstance(entry, dict) and entry.get("name") == column_name:
-            return entry
-    new_column: Dict[str, Any] = {"name": column_name}
-    columns.append(new_column)
-    return new_column
+    if description is None:
+        entry.pop("description", None)
+    else:
+        entry["description"] = description
+    return True
 
 
 def apply_model_update(
-    yaml_document: Dict[str, Any], model_update: Dict[str, Any]
-) -> List[str]:
+    model_index: Dict[str, Dict[str, Any]],
+    column_indexes: Dict[str, Tuple[List[Any], Dict[str, Dict[str, Any]]]],
+    model_update: Dict[str, Any],
+    edits: Optional[Dict[int, Tuple[Any, Any]]] = None,
+) -> Tuple[List[str], bool]:
     """Apply updates for a single model within an already-loaded YAML document.
     
     Args:
-        yaml_document: The loaded YAML document (e.g., {"models": [...]})
+        model_index: Models of the loaded YAML document, keyed by name
+        column_indexes: Per-model column lists and their name indexes, filled
+            in as models are touched
         model_update: Update spec with model_name, column_changes, model_description
+        edits: Optional record of changed entries, see `set_description`
     
     Returns:
-        List of updated column names
+        Tuple of (updated column names, whether the model description changed)
     """
     model_name = model_update.get("model_name")
     column_changes = model_update.get("column_changes", [])
     model_description = model_update.get("model_description")
 
-    if not column_changes and "model_description" not in model_update:
-        return []
+    if not has_changes(model_update):
+        return [], False
 
-    models = ensure_sequence(yaml_document.get("models"), "models")
-    model = find_model(models, model_name)
-    columns = ensure_sequence(model.get("columns"), "columns")
-    model["columns"] = columns
+    model = find_model(model_index, model_name)
+    # `columns` is validated once per model; later updates reuse the cached list.
+    cached = column_indexes.get(model_name)
+    if cached is None:
+        columns = ensure_sequence(model.get("columns"), "columns")
+        cached = column_indexes[model_name] = (columns, index_by_name(columns))
+    columns, col_index = cached
+    if column_changes:
+        model["columns"] = columns
 
     updated_columns: List[str] = []
+    new_columns: List[Dict[str, Any]] = []
+    model_touched = False
 
     # Apply model description change if present
     if "model_description" in model_update:
-        if model_description is None:
-            if "description" in model:
-                model.pop("description", None)
-        else:
-            if model.get("description") != model_description:
-                model["description"] = model_description
+        model_touched = set_description(model, model_description, edits)
 
     # Apply column changes
     for change in column_changes:
         column_name = change.get("column_name")
         if not column_name:
             continue
-        column = ensure_column(columns, column_name)
-        new_description = change.get("new_description")
-        current_description = column.get("description")
-        if new_description is None:
-            if "description" in column:
-                column.pop("description", None)
-                updated_columns.append(column_name)
-        elif current_description != new_description:
-            column["description"] = new_description
+        column = ensure_column(new_columns, col_index, column_name)
+        if set_description(column, change.get("new_description"), edits):
             updated_columns.append(column_name)
 
-    return updated_columns
+    if new_columns:
+        columns.extend(new_columns)
+
+    return updated_columns, model_touched
+
+
+def render_scalar(value: Any) -> Optional[str]:
+    """Render an existing description as a single-line plain or double-quoted scalar.
+
+    Returns None for values that cannot be written that way, e.g. non-strings
+    or strings loaded from single-quoted, literal or folded scalars.
+    """
+    if isinstance(value, DoubleQuotedScalarString):
+        return json.dumps(str(value), ensure_ascii=False)
+    if type(value) is not str:
+        return None
+    if is_plain_safe(value):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
 
+def is_plain_safe(value: str) -> bool:
+    """Check that `value` reads back as the same string when written unquoted."""
+    if not value or value != value.strip() or "\n" in value or "\r" in value:
+        return False
+    return resolves_to_str(value) and reads_back(value, value)
+
+
+def reads_back(text: str, value: str) -> bool:
+    """Check that the scalar `text` loads as `value` under YAML 1.2 and libyaml."""
+    data = f"description: {text}\n".encode("utf-8")
+    try:
+        return (
+            safe_yaml().load(data) == {"description": value}
+            and safe_load(data) == {"description": value}
+        )
+    except (YAMLError, PyYAMLError):
+        return False
+
+
+def emit_scalar(value: Any, column: int) -> Optional[str]:
+    """Render a new description exactly as the round-trip dump would write it.
+
+    The scalar is emitted by ruamel after a key padded to end at `column`, so
+    quoting and wrapping match a full dump. Returns None for non-strings and
+    for values the dump would not keep on the line they start on.
+    """
+    if type(value) is not str or not 2 < column < 80:
+        return None
+    key = "k" * (column - 2)
+    buffer = io.StringIO()
+    rt_yaml().dump({key: value}, buffer)
+    text, _, rest = buffer.getvalue().partition("\n")
+    if rest or not text.startswith(f"{key}: "):
+        return None
+    return text[column:]
+
+
+def splice_descriptions(
+    data: bytes, document: Any, edits: Dict[int, Tuple[Any, Any]]
+) -> Optional[bytes]:
+    """Write changed descriptions straight into the original file contents.
+
+    Only handles descriptions that replace an existing single-line plain or
+    double-quoted scalar with another string that the dump would also write on
+    one line; everything else returns None so the caller falls back to dumping
+    the whole document. Each new scalar is re-read with the YAML 1.2 loader,
+    and the whole result is re-loaded and compared against `document` before
+    it is trusted.
+    """
+    if not edits or data.startswith(codecs.BOM_UTF8):
+        return None
+    try:
+        lines = data.decode("utf-8").split("\n")
+    except UnicodeDecodeError:
+        return None
+
+    for entry, original in edits.values():
+        old_text = render_scalar(original)
+        if old_text is None or not hasattr(entry, "lc"):
+            return None
+        line_number, column = entry.lc.value("description")
+        new_value = entry.get("description", _MISSING)
+        new_text = emit_scalar(new_value, column)
+        if new_text is None or not reads_back(new_text, new_value):
+            return None
+
+        line = lines[line_number]
+        content = line.rstrip("\r")
+        if "\r" in content or content[column:].rstrip() != old_text:
+            return None
+        lines[line_number] = content[:column] + new_text + line[len(content) :]
+
+    spliced = "\n".join(lines).encode("utf-8")
+    try:
+        if safe_load(spliced) != document:
+            return None
+    except (YAMLError, PyYAMLError):
+        return None
+    return spliced
+
+
+def new_descriptions(model_updates: List[Dict[str, Any]]) -> Set[str]:
+    """Collect every description an update would write."""
+    descriptions = {update.get("model_description") for update in model_updates}
+    for model_update in model_updates:
+        for change in model_update.get("column_changes", []):
+            descriptions.add(change.get("new_description"))
+    descriptions.discard(None)
+    return descriptions
 
-def apply_updates(payload: Dict[str, Any]) -> Dict[str, List[str]]:
+
+def apply_document_updates(
+    document: Any,
+    model_updates: List[Dict[str, Any]],
+    edits: Optional[Dict[int, Tuple[Any, Any]]] = None,
+) -> Tuple[Dict[str, List[str]], int]:
+    """Apply every model update to a loaded document in a single pass.
+
+    Returns:
+        Tuple of (model_name to updated column names, number of changes)
+    """
+    model_index = index_by_name(ensure_sequence(document.get("models"), "models"))
+    column_indexes: Dict[str, Tuple[List[Any], Dict[str, Dict[str, Any]]]] = {}
+
+    results: Dict[str, List[str]] = {}
+    change_count = 0
+
+    for model_update in model_updates:
+        updated_cols, model_touched = apply_model_update(
+            model_index, column_indexes, model_update, edits
+        )
+        change_count += len(updated_cols) + int(model_touched)
+        if updated_cols:
+            results[model_update.get("model_name", "")] = updated_cols
+    return results, change_count
+
+
+def apply_file_updates(payload: Dict[str, Any]) -> Dict[str, List[str]]:
     """Apply batch updates to a single YAML file.
     
     Args:
@@ -128,39 +573,99 @@ def apply_updates(payload: Dict[str, Any]) -> Dict[str, List[str]]:
         Dict mapping model_name to list of updated column names
     """
     patch_path = Path(payload["patch_path"])
-    model_updates = payload.get("models", [])
+    model_updates = [update for update in payload.get("models", []) if has_changes(update)]
 
     if not model_updates:
         return {}
 
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.indent(mapping=2, sequence=4, offset=2)
+    try:
+        stat = patch_path.stat()
+    except FileNotFoundError:
+        raise PatchError(f"YAML file `{patch_path}` not found") from None
+
+    # Cheap pre-scan: only pay for the round-trip parse when something differs.
+    # Large files are mapped rather than copied, and only read in full once an
+    # update is known to be needed.
+    data: Optional[bytes] = None
+    if stat.st_size >= _MMAP_THRESHOLD:
+        with mapped_file(patch_path) as contents:
+            check_models_present(contents, model_updates)
+            safe_document = safe_load(contents) or {}
+    else:
+        data = patch_path.read_bytes()
+        check_models_present(data, model_updates)
+        safe_document = safe_load(data) or {}
+    if not needs_update(safe_document, model_updates):
+        return {}
 
-    if not patch_path.exists():
-        raise PatchError(f"YAML file `{patch_path}` not found")
+    if data is None:
+        data = patch_path.read_bytes()
+
+    # Files without comments or custom formatting can skip ruamel entirely and
+    # be mutated in the already-loaded plain document, unless a new description
+    # would wrap: ruamel lays those out differently, so it writes them instead.
+    if can_use_fast_path(data, safe_document):
+        results, change_count = apply_document_updates(safe_document, model_updates)
+        if not change_count:
+            return results
+        buffer = io.StringIO()
+        if fast_dump(safe_document, buffer, new_descriptions(model_updates)):
+            patch_path.write_text(buffer.getvalue(), encoding="utf-8")
+            return results
+
+    yaml = rt_yaml()
+    # ruamel keeps `\r` in comment tokens, which the dump would write back.
+    document = yaml.load(data.replace(b"\r\n", b"\n")) or {}
+    edits: Dict[int, Tuple[Any, Any]] = {}
+    results, change_count = apply_document_updates(document, model_updates, edits)
+
+    # Write once, and only if a description actually changed
+    if change_count:
+        spliced = splice_descriptions(data, document, edits)
+        if spliced is not None:
+            # Only the changed lines differ, so keep the file's own line endings.
+            patch_path.write_bytes(spliced)
+        else:
+            buffer = io.StringIO()
+            yaml.dump(document, buffer)
+            patch_path.write_text(buffer.getvalue(), encoding="utf-8")
 
-    with patch_path.open("r", encoding="utf-8") as handle:
-        document = yaml.load(handle) or {}
+    return results
 
-    results: Dict[str, List[str]] = {}
-    file_mutated = False
 
-    # Process all models in a single pass through the document
-    for model_update in model_updates:
-        updated_cols = apply_model_update(document, model_update)
-        if updated_cols:
-            file_mutated = True
-            results[model_update.get("model_name", "")] = updated_cols
+def apply_updates(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply updates for either a single-file or a multi-file payload.
 
-    # Write once if anything changed
-    if file_mutated:
-        with patch_path.open("w", encoding="utf-8") as handle:
-            yaml.dump(document, handle)
+    Args:
+        payload: Either a single-file payload (see `apply_file_updates`) or
+            a dict with `files`, a list of single-file payloads
 
+    Returns:
+        For a single-file payload, a dict mapping model_name to updated
+        column names. For a multi-file payload, a dict mapping each
+        patch_path (as given) to such a dict.
+    """
+    if "files" not in payload:
+        return apply_file_updates(payload)
+
+    results: Dict[str, Dict[str, List[str]]] = {}
+    for file_payload in payload["files"]:
+        file_results = results.setdefault(str(file_payload["patch_path"]), {})
+        for model_name, updated_cols in apply_file_updates(file_payload).items():
+            file_results.setdefault(model_name, []).extend(updated_cols)
     return results
 
 
+def write_response(response: Dict[str, Any]) -> None:
+    """Write `response` as JSON to stdout with a single write."""
+    if orjson_dumps is not None:
+        data = orjson_dumps(response)
+    else:
+        data = json.dumps(response).encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 def main() -> int:
     try:
         payload = load_payload()
@@ -172,7 +677,7 @@ def main() -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
-    json.dump({"results": results}, sys.stdout)
+    write_response({"results": results})
     return 0
 
 
@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
-"""Normalize dbt model properties layout while preserving YAML formatting."""
+"""Normalize dbt model properties layout while preserving YAML formatting.
+
+The payload is either a single move (current_patch, expected_patch,
+model_name) or `{"moves": [...]}` with several of them. Moves in a batch
+share their loaded documents, and every touched file is written once at
+the end.
+"""
 
 from __future__ import annotations
 
+import io
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from ruamel.yaml import YAML
@@ -18,6 +25,18 @@ except ImportError:  # pragma: no cover - surface dependency error clearly
     )
     raise
 
+try:
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads
+
+    orjson_dumps = None
+
+
+# Built lazily and shared for the lifetime of the process.
+_RT_YAML: Optional[YAML] = None
+
 
 class LayoutError(Exception):
     """Raised when the YAML structure does not match expectations."""
@@ -25,24 +44,32 @@ class LayoutError(Exception):
 
 def load_request() -> Dict[str, Any]:
     try:
-        return json.load(sys.stdin)
+        return json_loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as exc:  # pragma: no cover - payload contract violation
         raise LayoutError(f"Invalid JSON payload: {exc}") from exc
 
 
-def init_yaml() -> YAML:
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.indent(mapping=2, sequence=4, offset=2)
-    return yaml
+def rt_yaml() -> YAML:
+    """Return the shared round-trip YAML instance used to load and dump files."""
+    global _RT_YAML
+    if _RT_YAML is None:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        _RT_YAML = yaml
+    return _RT_YAML
 
 
-def load_document(path: Path, yaml: YAML) -> CommentedMap:
-    if not path.exists():
+def load_document(path: Path, yaml: YAML, missing_ok: bool = True) -> CommentedMap:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        if not missing_ok:
+            raise LayoutError(f"YAML file `{path}` not found") from None
         return CommentedMap()
 
-    with path.open("r", encoding="utf-8") as handle:
-        document = yaml.load(handle) or CommentedMap()
+    # ruamel keeps `\r` in comment tokens, which the dump would write back.
+    document = yaml.load(data.replace(b"\r\n", b"\n")) or CommentedMap()
 
     if not isinstance(document, CommentedMap):
         raise LayoutError(f"YAML document `{path}` is not a mapping")
@@ -60,86 +87,134 @@ def ensure_model_sequence(doc: CommentedMap) -> CommentedSeq:
     return models  # type: ignore[return-value]
 
 
-def remove_model(doc: CommentedMap, model_name: str, source_path: Path) -> CommentedMap:
+def remove_model(
+    doc: CommentedMap, model_name: str, source_path: Path
+) -> Tuple[CommentedMap, Optional[List[Any]]]:
+    """Pop a model from `doc`, returning it with the sequence-level comment attached to it.
+
+    Popping from a `CommentedSeq` drops the comment stored for that index
+    (e.g. `- # comment` right after the dash), so it is handed back to the
+    caller to re-attach at the model's new position.
+    """
     models = ensure_model_sequence(doc)
     for index, entry in enumerate(models):
         if isinstance(entry, dict) and entry.get("name") == model_name:
+            comment = models.ca.items.get(index)
             model = models.pop(index)
             if not models:
                 doc.pop("models", None)
             if not isinstance(model, CommentedMap):
                 model = CommentedMap(model)
-            return model
+            return model, comment
     raise LayoutError(f"Model `{model_name}` not found in `{source_path}`")
 
 
-def upsert_model(doc: CommentedMap, model: CommentedMap, model_name: str) -> None:
+def upsert_model(
+    doc: CommentedMap,
+    model: CommentedMap,
+    model_name: str,
+    comment: Optional[List[Any]] = None,
+) -> None:
     models = ensure_model_sequence(doc)
     for index, entry in enumerate(models):
         if isinstance(entry, dict) and entry.get("name") == model_name:
             models[index] = model
             break
     else:
+        index = len(models)
         models.append(model)
 
+    if comment is not None:
+        models.ca.items[index] = comment
 
-def document_is_empty(doc: CommentedMap) -> bool:
-    models = doc.get("models")
-    sources = doc.get("sources")
-    other_keys = [key for key in doc.keys() if key not in {"models", "sources"}]
-
-    models_empty = not models
-    sources_empty = not sources
 
-    return models_empty and sources_empty and not other_keys
+def document_is_empty(doc: CommentedMap) -> bool:
+    if any(key not in ("models", "sources") for key in doc):
+        return False
+    return not doc.get("models") and not doc.get("sources")
 
 
 def write_or_remove(path: Path, yaml: YAML, doc: CommentedMap) -> None:
     if document_is_empty(doc):
-        if path.exists():
-            path.unlink()
+        path.unlink(missing_ok=True)
         return
 
-    if not path.parent.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open("w", encoding="utf-8") as handle:
-        yaml.dump(doc, handle)
+    # Emit into memory first so the file is written with a single call.
+    buffer = io.StringIO()
+    yaml.dump(doc, buffer)
+    path.write_text(buffer.getvalue(), encoding="utf-8")
+
+
+def cached_document(
+    docs: Dict[Path, CommentedMap], path: Path, yaml: YAML, missing_ok: bool = True
+) -> CommentedMap:
+    document = docs.get(path)
+    if document is None:
+        document = docs[path] = load_document(path, yaml, missing_ok)
+    return document
 
 
 def normalize_to_directory(
     yaml: YAML,
+    docs: Dict[Path, CommentedMap],
     current_path: Path,
     expected_path: Path,
     model_name: str,
 ) -> bool:
-    if not current_path.exists():
-        raise LayoutError(f"YAML file `{current_path}` not found")
+    """Move a model between documents held in `docs`, loading them on first use.
 
+    Nothing is written; see `normalize_many`.
+    """
     if current_path == expected_path:
+        if not current_path.exists():
+            raise LayoutError(f"YAML file `{current_path}` not found")
         return False
 
-    source_doc = load_document(current_path, yaml)
-    model = remove_model(source_doc, model_name, current_path)
+    source_doc = cached_document(docs, current_path, yaml, missing_ok=False)
+    model, comment = remove_model(source_doc, model_name, current_path)
 
-    target_doc = load_document(expected_path, yaml)
-    upsert_model(target_doc, model, model_name)
-
-    write_or_remove(current_path, yaml, source_doc)
-    write_or_remove(expected_path, yaml, target_doc)
+    target_doc = cached_document(docs, expected_path, yaml)
+    upsert_model(target_doc, model, model_name, comment)
     return True
 
 
+def normalize_many(yaml: YAML, moves: List[Dict[str, Any]]) -> bool:
+    """Apply every move, then write each touched document once."""
+    docs: Dict[Path, CommentedMap] = {}
+    mutated = False
+    for move in moves:
+        mutated |= normalize_to_directory(
+            yaml,
+            docs,
+            Path(move["current_patch"]),
+            Path(move["expected_patch"]),
+            move["model_name"],
+        )
+
+    for path, doc in docs.items():
+        write_or_remove(path, yaml, doc)
+    return mutated
+
+
+def write_response(response: Dict[str, Any]) -> None:
+    """Write `response` as JSON to stdout with a single write."""
+    if orjson_dumps is not None:
+        data = orjson_dumps(response)
+    else:
+        data = json.dumps(response).encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 def main() -> int:
     try:
         payload = load_request()
-        yaml = init_yaml()
-
-        current_path = Path(payload["current_patch"])
-        expected_path = Path(payload["expected_patch"])
-        model_name = payload["model_name"]
+        yaml = rt_yaml()
 
-        mutated = normalize_to_directory(yaml, current_path, expected_path, model_name)
+        moves = payload["moves"] if "moves" in payload else [payload]
+        mutated = normalize_many(yaml, moves)
 
     except LayoutError as exc:
         print(str(exc), file=sys.stderr)
@@ -148,7 +223,7 @@ def main() -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
-    json.dump({"mutated": mutated}, sys.stdout)
+    write_response({"mutated": mutated})
     return 0
 
 
@@ -31,9 +31,16 @@ struct PythonBatchRequest {
     models: Vec<ModelUpdate>,
 }
 
+/// Multi-file request: every pending file update sent to a single Python process
+#[derive(Debug, Serialize)]
+struct PythonMultiFileRequest {
+    files: Vec<PythonBatchRequest>,
+}
+
+/// Results keyed by patch path, then by model name
 #[derive(Debug, Deserialize)]
-struct PythonBatchResponse {
-    results: BTreeMap<String, Vec<String>>,
+struct PythonMultiFileResponse {
+    results: BTreeMap<String, BTreeMap<String, Vec<String>>>,
 }
 
 #[derive(Debug, Serialize)]
@@ -53,6 +60,12 @@ impl LayoutRequest {
     }
 }
 
+/// Batch of layout moves applied by a single Python process call
+#[derive(Debug, Serialize)]
+struct LayoutBatchRequest {
+    moves: Vec<LayoutRequest>,
+}
+
 #[derive(Debug, Deserialize)]
 struct LayoutResponse {
     mutated: bool,
@@ -69,11 +82,13 @@ pub fn apply_with_python(
     use crate::writeback::changes::group_changes_by_file;
 
     let helper_path = resolve_helper_path()?;
-    let mut layout_helper_path: Option<std::path::PathBuf> = None;
+    let mut layout_moves: Vec<LayoutRequest> = Vec::new();
 
     let mut results = Vec::new();
+    let mut file_requests: Vec<PythonBatchRequest> = Vec::new();
+    let mut pending_models: Vec<(String, Vec<String>)> = Vec::new();
 
-    // Group changes by file for batching: one Python process call per file
+    // Group changes by file for batching: all files are sent to a single Python process call
     let grouped_changes = group_changes_by_file(changes);
 
     for (_patch_path, models_for_file) in grouped_changes {
@@ -130,18 +145,11 @@ pub fn apply_with_python(
                         };
 
                         if resolved_current != resolved_expected {
-                            if layout_helper_path.is_none() {
-                                layout_helper_path = Some(resolve_layout_helper_path()?);
-                            }
-                            let helper = layout_helper_path.as_ref().expect("layout helper set");
-                            let _mutated = invoke_layout_helper(
-                                helper,
-                                LayoutRequest::new(
-                                    &resolved_current,
-                                    &resolved_expected,
-                                    model_name,
-                                ),
-                            )?;
+                            layout_moves.push(LayoutRequest::new(
+                                &resolved_current,
+                                &resolved_expected,
+                                model_name,
+                            ));
                         }
 
                         current_path = resolved_expected;
@@ -209,32 +217,51 @@ pub fn apply_with_python(
             }
         }
 
-        // Single batch call to Python for all models in this file
+        // Queue all models in this file for the single Python call below
         if let Some(patch_path) = resolved_path
             && !batch_updates.is_empty()
         {
-            let model_updates: Vec<ModelUpdate> = batch_updates
-                .iter()
-                .map(|(_, update)| update.clone())
-                .collect();
+            let (model_ids, model_updates): (Vec<String>, Vec<ModelUpdate>) =
+                batch_updates.into_iter().unzip();
 
-            let request = PythonBatchRequest {
+            pending_models.push((patch_path.to_string_lossy().into_owned(), model_ids));
+            file_requests.push(PythonBatchRequest {
                 patch_path,
                 models: model_updates,
-            };
+            });
+        }
+    }
 
-            let response = invoke_python_batch_helper(&helper_path, &request)?;
-
-            // Map responses back to model IDs
-            for (model_id, _) in batch_updates {
-                let model_name = extract_model_name(&model_id).to_string();
-                let updated_cols = response
-                    .results
-                    .get(&model_name)
-                    .cloned()
-                    .unwrap_or_default();
-                results.push((model_id, updated_cols));
-            }
+    // All layout moves run in one call, before any description updates
+    if !layout_moves.is_empty() {
+        let layout_helper_path = resolve_layout_helper_path()?;
+        let _mutated = invoke_layout_helper(
+            &layout_helper_path,
+            &LayoutBatchRequest {
+                moves: layout_moves,
+            },
+        )?;
+    }
+
+    if file_requests.is_empty() {
+        return Ok(results);
+    }
+
+    let request = PythonMultiFileRequest {
+        files: file_requests,
+    };
+    let response = invoke_python_batch_helper(&helper_path, &request)?;
+
+    // Map responses back to model IDs
+    for (patch_key, model_ids) in pending_models {
+        let file_results = response.results.get(&patch_key);
+        for model_id in model_ids {
+            let model_name = extract_model_name(&model_id);
+            let updated_cols = file_results
+                .and_then(|models| models.get(model_name))
+                .cloned()
+                .unwrap_or_default();
+            results.push((model_id, updated_cols));
         }
     }
 
@@ -305,7 +332,7 @@ fn resolve_layout_helper_path() -> Result<std::path::PathBuf, WriteBackError> {
 
 fn invoke_layout_helper(
     helper_path: &Path,
-    request: LayoutRequest,
+    request: &LayoutBatchRequest,
 ) -> Result<bool, WriteBackError> {
     let mut command = Command::new("python3");
     command.arg(helper_path);
@@ -316,7 +343,7 @@ fn invoke_layout_helper(
     let mut child = command.spawn()?;
 
     if let Some(mut stdin) = child.stdin.take() {
-        let json = serde_json::to_vec(&request)?;
+        let json = serde_json::to_vec(request)?;
         stdin.write_all(&json)?;
     }
 
@@ -336,8 +363,8 @@ fn invoke_layout_helper(
 
 fn invoke_python_batch_helper(
     helper_path: &Path,
-    request: &PythonBatchRequest,
-) -> Result<PythonBatchResponse, WriteBackError> {
+    request: &PythonMultiFileRequest,
+) -> Result<PythonMultiFileResponse, WriteBackError> {
     let mut command = Command::new("python3");
     command.arg(helper_path);
     command.stdin(Stdio::piped());
@@ -359,7 +386,7 @@ fn invoke_python_batch_helper(
         return Err(WriteBackError::PythonFailure { status, stderr });
     }
 
-    let response: PythonBatchResponse =
+    let response: PythonMultiFileResponse =
         serde_json::from_slice(&output.stdout).map_err(WriteBackError::ResponseParseFailure)?;
 
     Ok(response)
@@ -0,0 +1,268 @@
+use assert_fs::TempDir;
+use dbt_lint_yaml::change_descriptors::{ModelChange, ModelChanges};
+use dbt_lint_yaml::writeback::properties::{ColumnProperty, ModelProperty};
+use dbt_lint_yaml::writeback::python::apply_with_python;
+use std::collections::BTreeMap;
+use std::error::Error;
+use std::fs;
+use std::io::Write;
+use std::path::{Path, PathBuf};
+use std::process::{Command, Stdio};
+
+// Run a helper script from `scripts/` on `payload` and return its parsed JSON response.
+fn run_helper(
+    script: &str,
+    payload: &serde_json::Value,
+) -> Result<serde_json::Value, Box<dyn Error>> {
+    let helper = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .join("scripts")
+        .join(script);
+    let mut child = Command::new("python3")
+        .arg(helper)
+        .stdin(Stdio::piped())
+        .stdout(Stdio::piped())
+        .stderr(Stdio::piped())
+        .spawn()?;
+    child
+        .stdin
+        .take()
+        .expect("stdin is piped")
+        .write_all(payload.to_string().as_bytes())?;
+    let output = child.wait_with_output()?;
+    assert!(
+        output.status.success(),
+        "helper failed: {}",
+        String::from_utf8_lossy(&output.stderr)
+    );
+    Ok(serde_json::from_slice(&output.stdout)?)
+}
+
+// Set the description of column `amount` on model `m`.
+fn set_amount_description(patch_path: &Path, description: &str) -> Result<(), Box<dyn Error>> {
+    let payload = serde_json::json!({
+        "patch_path": patch_path,
+        "models": [{
+            "model_name": "m",
+            "column_changes": [{"column_name": "amount", "new_description": description}],
+        }],
+    });
+    run_helper("ruamel_model_changes.py", &payload)?;
+    Ok(())
+}
+
+// `1e3` is a string under YAML 1.1 (PyYAML) but a float under YAML 1.2 (ruamel, dbt),
+// so it must be written quoted, and single-quoted as a full ruamel dump would.
+fn assert_exponent_description_quoted(contents: &str) -> Result<(), Box<dyn Error>> {
+    let temp = TempDir::new()?;
+    let patch_path = temp.path().join("a.yml");
+    fs::write(&patch_path, contents)?;
+
+    set_amount_description(&patch_path, "1e3")?;
+
+    let updated = fs::read_to_string(&patch_path)?;
+    assert!(
+        updated.contains("description: '1e3'\n"),
+        "description not written as '1e3':\n{updated}"
+    );
+    Ok(())
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_spliced_description_quotes_yaml_1_2_float() -> Result<(), Box<dyn Error>> {
+    // the comment keeps this file on the ruamel round-trip path, where descriptions are spliced
+    assert_exponent_description_quoted(
+        "# properties\nmodels:\n  - name: m\n    columns:\n      - name: amount\n        description: money\n",
+    )
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_fast_path_description_quotes_yaml_1_2_float() -> Result<(), Box<dyn Error>> {
+    // a comment-free file that PyYAML reproduces byte for byte is rewritten on the fast path
+    assert_exponent_description_quoted(
+        "models:\n  - name: m\n    columns:\n      - name: amount\n        description: money\n",
+    )
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_fast_path_multiline_description_matches_round_trip_style() -> Result<(), Box<dyn Error>> {
+    let temp = TempDir::new()?;
+    let patch_path = temp.path().join("a.yml");
+    fs::write(
+        &patch_path,
+        "models:\n  - name: m\n    columns:\n      - name: amount\n        description: money\n",
+    )?;
+
+    set_amount_description(&patch_path, "multi\nline")?;
+
+    // ruamel double-quotes multi-line values; the fast path must not fold them instead
+    let updated = fs::read_to_string(&patch_path)?;
+    assert!(
+        updated.contains(r#"description: "multi\nline""#),
+        "unexpected style:\n{updated}"
+    );
+    Ok(())
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_model_description_only_update_is_written() -> Result<(), Box<dyn Error>> {
+    let temp = TempDir::new()?;
+    let patch_path = temp.path().join("a.yml");
+    fs::write(
+        &patch_path,
+        "# properties\nmodels:\n  - name: m\n    description: old\n    columns:\n      - name: amount\n",
+    )?;
+
+    // no column changes: only the model description count decides whether the file is written
+    let payload = serde_json::json!({
+        "patch_path": patch_path,
+        "models": [{"model_name": "m", "column_changes": [], "model_description": "new"}],
+    });
+    let response = run_helper("ruamel_model_changes.py", &payload)?;
+    assert_eq!(response, serde_json::json!({"results": {}}));
+
+    let updated = fs::read_to_string(&patch_path)?;
+    assert!(
+        updated.contains("    description: new\n"),
+        "model description not written:\n{updated}"
+    );
+    Ok(())
+}
+
+// A change setting the description of column `id` on `model_name`, whose properties are in `patch_path`.
+fn describe_id(model_name: &str, patch_path: &Path, description: &str) -> ModelChange {
+    ModelChange::ChangePropertiesFile {
+        model_id: format!("model.shop.{model_name}"),
+        model_name: model_name.to_string(),
+        patch_path: Some(patch_path.to_path_buf()),
+        property: Some(ModelProperty {
+            name: Some(model_name.to_string()),
+            description: None,
+            columns: vec![ColumnProperty {
+                name: "id".to_string(),
+                description: Some(description.to_string()),
+                extras: BTreeMap::new(),
+            }],
+            extras: BTreeMap::new(),
+        }),
+    }
+}
+
+// Write a properties file for `model_name` with a single undocumented `id` column.
+fn write_model_properties(patch_path: &Path, model_name: &str) -> Result<(), Box<dyn Error>> {
+    fs::create_dir_all(patch_path.parent().expect("patch path has a parent"))?;
+    fs::write(
+        patch_path,
+        format!("models:\n  - name: {model_name}\n    columns:\n      - name: id\n"),
+    )?;
+    Ok(())
+}
+
+fn model_changes(
+    model_name: &str,
+    patch_path: &Path,
+    changes: Vec<ModelChange>,
+) -> (String, ModelChanges) {
+    let model_id = format!("model.shop.{model_name}");
+    let model_changes = ModelChanges {
+        model_id: model_id.clone(),
+        patch_path: Some(patch_path.to_path_buf()),
+        changes,
+        ..Default::default()
+    };
+    (model_id, model_changes)
+}
+
+fn updated_id(model_name: &str) -> (String, Vec<String>) {
+    (format!("model.shop.{model_name}"), vec!["id".to_string()])
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_apply_with_python_updates_several_files_in_one_call() -> Result<(), Box<dyn Error>> {
+    let temp = TempDir::new()?;
+    let alpha = temp.path().join("models/alpha/alpha.yml");
+    let beta = temp.path().join("models/beta/beta.yml");
+    write_model_properties(&alpha, "alpha")?;
+    write_model_properties(&beta, "beta")?;
+
+    let changes = BTreeMap::from([
+        model_changes(
+            "alpha",
+            &alpha,
+            vec![describe_id("alpha", &alpha, "Alpha id")],
+        ),
+        model_changes("beta", &beta, vec![describe_id("beta", &beta, "Beta id")]),
+    ]);
+    let mut results = apply_with_python(temp.path(), &changes)?;
+    results.sort();
+
+    // both files go out in one `{"files": [...]}` request; results come back keyed by path
+    assert_eq!(results, vec![updated_id("alpha"), updated_id("beta")]);
+    assert!(fs::read_to_string(&alpha)?.contains("description: Alpha id\n"));
+    assert!(fs::read_to_string(&beta)?.contains("description: Beta id\n"));
+    Ok(())
+}
+
+fn move_to(model_name: &str, patch_path: &Path, new_path: &Path) -> ModelChange {
+    ModelChange::MovePropertiesFile {
+        model_id: format!("model.shop.{model_name}"),
+        model_name: model_name.to_string(),
+        patch_path: Some(patch_path.to_path_buf()),
+        new_path: new_path.to_path_buf(),
+    }
+}
+
+#[test]
+#[ignore = "reason: needs python3 with ruamel.yaml installed."]
+fn test_apply_with_python_moves_two_models_into_one_file() -> Result<(), Box<dyn Error>> {
+    let temp = TempDir::new()?;
+    let alpha = temp.path().join("models/alpha/alpha.yml");
+    let beta = temp.path().join("models/beta/beta.yml");
+    let target = temp.path().join("models/_models.yml");
+    write_model_properties(&alpha, "alpha")?;
+    write_model_properties(&beta, "beta")?;
+
+    let changes = BTreeMap::from([
+        model_changes(
+            "alpha",
+            &alpha,
+            vec![
+                move_to("alpha", &alpha, &target),
+                describe_id("alpha", &alpha, "Alpha id"),
+            ],
+        ),
+        model_changes(
+            "beta",
+            &beta,
+            vec![
+                move_to("beta", &beta, &target),
+                describe_id("beta", &beta, "Beta id"),
+            ],
+        ),
+    ]);
+    let mut results = apply_with_python(temp.path(), &changes)?;
+    results.sort();
+
+    // both moves run in one `{"moves": [...]}` call before any description update, and the
+    // two updates for the shared target have their results merged under the one path
+    assert_eq!(results, vec![updated_id("alpha"), updated_id("beta")]);
+    assert!(!alpha.exists(), "emptied source file was not removed");
+    assert!(!beta.exists(), "emptied source file was not removed");
+    let moved = fs::read_to_string(&target)?;
+    for expected in [
+        "- name: alpha\n",
+        "- name: beta\n",
+        "description: Alpha id\n",
+        "description: Beta id\n",
+    ] {
+        assert!(
+            moved.contains(expected),
+            "missing `{expected}` in:\n{moved}"
+        );
+    }
+    Ok(())
+}